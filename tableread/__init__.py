@@ -1,10 +1,10 @@
 """Tableread package to read a text file table into a Python object."""
 
-import os
+import re
 from collections import OrderedDict
-from itertools import filterfalse
+from functools import lru_cache
 from operator import attrgetter
-from typing import Any, Callable, List, Optional, Tuple, Union
+from typing import Any, Callable, Iterable, List, Optional, Sequence, Tuple, Union
 
 import attr
 
@@ -12,6 +12,10 @@ import attr
 FilePath = str
 FileContents = str
 
+# Line classification flags; a plain "=====" row is both a divider and an underline
+_DIVIDER = 1
+_UNDERLINE = 2
+
 
 class InvalidFileException(Exception):
     """Exception for improperly formatted files."""
@@ -25,6 +29,13 @@ class FileParsingException(Exception):
     pass
 
 
+@lru_cache(maxsize=32)
+def _divider_pattern(header_divider: str, column_divider_char: str):
+    header_divider = re.escape(header_divider)
+    column_divider_char = re.escape(column_divider_char)
+    return re.compile("{0}[{0}{1} ]*".format(header_divider, column_divider_char))
+
+
 def _safe_name(name: str):
     return name.replace(" ", "_").replace(".", "_").lower()
 
@@ -42,7 +53,40 @@ def get_specific_attr_matcher(key: str, value: str):
         and return True if the attribute value matches, or False if not.
 
     """
-    return lambda x: getattr(x, key).lower() == value.lower()
+    getter = attrgetter(key)
+    expected = value.lower()
+    return lambda x: getter(x).lower() == expected
+
+
+# Row classes are keyed by their field names, so tables sharing a schema share a class
+@lru_cache(maxsize=256)
+def _row_class(fields: Tuple[str, ...]):
+    return attr.make_class("Row", list(fields), hash=True)
+
+
+# The row class is part of the parser key, so a parser never outlives its class entry
+@lru_cache(maxsize=256)
+def _row_parser(
+    row_class: type,
+    defaults: Tuple[str, ...],
+    column_spans: Tuple[Tuple[int, Optional[int]], ...],
+):
+    # Generate a straight-line parser with the column slices and defaults inlined.
+    # Slicing past the end of a short row is safe, so rows need no padding here.
+    # Blank cells need no special case: strip returns "" in a single scan.
+    source = ["def parse_row(row):"]
+    for idx, (start, stop) in enumerate(column_spans):
+        stop_index = "" if stop is None else stop
+        source.append("    c{} = row[{}:{}].strip()".format(idx, start, stop_index))
+        source.append('    if ".." in c{}:'.format(idx))
+        source.append('        c{0} = c{0}.replace("..", "")'.format(idx))
+    values = ", ".join(
+        "c{} or {!r}".format(idx, default) for idx, default in enumerate(defaults)
+    )
+    source.append("    return row_class({})".format(values))
+    namespace = {"row_class": row_class}
+    exec("\n".join(source), namespace)
+    return namespace["parse_row"]
 
 
 def safe_list_index(a_list: list, index_value: int, default: Any = None):
@@ -73,7 +117,7 @@ class BaseRSTDataObject(object):
     header_divider = "="
     # The full set of potential ReStructuredText section markers is sourced from
     # http://docutils.sourceforge.net/docs/ref/rst/restructuredtext.html#sections
-    header_markers = set(r'!"#$%&\'()*+,-./:;<=>?@[]^_`{|}~')
+    header_markers = frozenset(r'!"#$%&\'()*+,-./:;<=>?@[]^_`{|}~')
     column_default_separator = "="
     comment_char = "#"
     data_format: Any = None
@@ -95,19 +139,19 @@ class BaseRSTDataObject(object):
         return self.data[key]
 
     def _is_divider_row(self, row: str):
-        if not row.startswith(self.header_divider):
+        if row[:1] != self.header_divider:
             return False
-        return self.header_divider in row and set(row) <= {
-            self.column_divider_char,
-            self.header_divider,
-            " ",
-        }
+        pattern = _divider_pattern(self.header_divider, self.column_divider_char)
+        return pattern.fullmatch(row) is not None
 
 
 class SimpleRSTTable(BaseRSTDataObject):
     """Represent a single table from a RST file."""
 
     data_format = list
+    # only set on lazy views built by ``from_data`` with a predicate
+    _source: Sequence[Any]
+    _predicate: Callable[[Any], bool]
 
     def __init__(self, divider_row: str, header: str, rows: List[str]):
         """
@@ -124,16 +168,44 @@ class SimpleRSTTable(BaseRSTDataObject):
         self._header = header
         self._rows = rows
         self._column_spans = self._build_column_spans(divider_row)
+        self._column_slices = [slice(start, stop) for start, stop in self._column_spans]
         self._row_length = len(divider_row)
         self._build_data()
 
     @classmethod
-    def from_data(cls, data: List[dict]):
-        """Given data, build a SimpleRSTTable object."""
+    def from_data(
+        cls, data: Iterable, predicate: Optional[Callable[[Any], bool]] = None
+    ):
+        """
+        Given data, build a SimpleRSTTable object.
+
+        When a ``predicate`` is given, the table is a lazy view over ``data``
+        that is only filtered the first time the table's data is used.
+        A list or tuple is read as-is rather than copied,
+        so changes made to it before then are seen by the view.
+        """
         table = cls.__new__(cls)
-        table.data = list(data)
+        if predicate is None:
+            table.data = list(data)
+        else:
+            if not isinstance(data, (list, tuple)):
+                data = tuple(data)
+            table._source, table._predicate = data, predicate
+            table._data = None
         return table
 
+    @property
+    def data(self):
+        """Get the rows of the table, filtering them first if this is a lazy view."""
+        if self._data is None:
+            self._data = list(filter(self._predicate, self._source))
+            del self._source, self._predicate
+        return self._data
+
+    @data.setter
+    def data(self, value: List):
+        self._data = value
+
     def _build_column_spans(self, divider_row: str):
         # remove any trailing whitespace from the end of the row
         divider_row = divider_row.rstrip()
@@ -154,12 +226,12 @@ class SimpleRSTTable(BaseRSTDataObject):
         if not self._column_spans:
             raise FileParsingException("Column spans not defined!")
         # first, pad the row with spaces in case end columns are left empty
-        row = "{row:{length}}".format(row=row, length=self._row_length)
+        row = row.ljust(self._row_length)
         # then, find the columns in the row
         columns = []
-        for (col_start, col_stop) in self._column_spans:
-            column = row[col_start:col_stop]
-            columns.append(column.strip().replace("..", ""))
+        for column_slice in self._column_slices:
+            column = row[column_slice].strip()
+            columns.append(column.replace("..", "") if ".." in column else column)
         return columns
 
     def _set_header_names_and_defaults(self, fields: List[str]):
@@ -169,33 +241,45 @@ class SimpleRSTTable(BaseRSTDataObject):
 
     def _build_data(self):
         self._set_header_names_and_defaults(self._row_splitter(self._header))
-        row_class = attr.make_class("Row", self.fields, hash=True)
+        parse_row = _row_parser(
+            _row_class(tuple(self.fields)),
+            tuple(self.defaults),
+            tuple(self._column_spans),
+        )
+        comment_sep = " " + self.comment_char + " "
+        single_column = len(self._column_spans) == 1
         for row in self._rows:
             if self._stop_checker(row):
                 break
             if "\t" in row:
                 raise TabError("Tabs are not supported in tables - use spaces only!")
-            row = row.split(" {} ".format(self.comment_char))[0]
-            if row.count(self.column_divider_char) or len(self._column_spans) == 1:
-                row = self._row_splitter(row)
-                if len(row) != len(self.fields):
-                    message = "Row '{}' does not match field list '{}' length."
-                    raise InvalidFileException(message.format(row, self.fields))
-                row_data = (
-                    value if value else default
-                    for default, value in zip(self.defaults, row)
-                )
-                self.data.append(row_class(*row_data))
+            row = row.partition(comment_sep)[0]
+            if self.column_divider_char in row or single_column:
+                self.data.append(parse_row(row))
 
-    def _filter_data(
-        self, data: List[dict], filter_kwargs: dict, filter_func: Callable
-    ):
+    def _filter_data(self, filter_kwargs: dict, exclude: bool = False):
         filters = [
             v if callable(v) else get_specific_attr_matcher(k, v)
             for k, v in filter_kwargs.items()
         ]
-        data = filter_func(lambda x: all(f(x) for f in filters), data)
-        return self.__class__.from_data(data)
+
+        def matcher(x):
+            return all(f(x) for f in filters)
+
+        predicate = (lambda x: not matcher(x)) if exclude else matcher
+        source = self._data if self._data is not None else self._source
+        # fail on unknown attributes now, rather than when the view is first used
+        if source:
+            for key, value in filter_kwargs.items():
+                if not callable(value):
+                    getattr(source[0], key)
+        if self._data is None:
+            # stack onto this view's predicate so chained filters make a single pass
+            parent = self._predicate
+            return self.__class__.from_data(
+                source, lambda x: parent(x) and predicate(x)
+            )
+        return self.__class__.from_data(source, predicate)
 
     def matches_all(self, **kwargs):
         """
@@ -206,10 +290,12 @@ class SimpleRSTTable(BaseRSTDataObject):
         that can be iterated over.
         Kwarg values may be a simple value (str, int)
         or a function that returns a boolean.
+        Filtering is deferred until the returned table is first used,
+        so filter functions are only called (and may only raise) at that point.
 
         Note: When filtering both keys and values are **not** case sensitive.
         """
-        return self._filter_data(self.data, kwargs, filter)
+        return self._filter_data(kwargs)
 
     def exclude_by(self, **kwargs):
         """
@@ -220,10 +306,12 @@ class SimpleRSTTable(BaseRSTDataObject):
         that can be iterated over.
         Kwarg values may be a simple value (str, int)
         or a function that returns a boolean.
+        Filtering is deferred until the returned table is first used,
+        so filter functions are only called (and may only raise) at that point.
 
         Note: When filtering both keys and values are **not** case sensitive.
         """
-        return self._filter_data(self.data, kwargs, filterfalse)
+        return self._filter_data(kwargs, exclude=True)
 
     def get_fields(self, *fields: str):
         """
@@ -260,24 +348,36 @@ class SimpleRSTReader(BaseRSTDataObject):
 
     @staticmethod
     def _read_file(file_path: FilePath):
-        if not os.path.exists(file_path):
-            raise FileNotFoundError("File not found: {}".format(file_path))
-        with open(file_path, "r") as rst_fo:
-            return rst_fo.read()
+        try:
+            with open(file_path, "r") as rst_fo:
+                return rst_fo.read()
+        except FileNotFoundError:
+            raise FileNotFoundError("File not found: {}".format(file_path)) from None
 
     @property
     def first(self):
         """Return the first table found in the document."""
-        return list(self.data.values())[0]
+        return next(iter(self.data.values()))
 
     def _is_header_underline(self, row: str):
-        return any((set(row) == set(x) for x in self.header_markers))
+        if not row:
+            return False
+        marker = row[0]
+        return marker in self.header_markers and row.count(marker) == len(row)
+
+    def _classify_lines(self, text_lines: List[str]):
+        # Lines stay ``str`` rather than ``bytes``: ASCII-only strings are already
+        # stored one byte per character, and column spans are character offsets
+        # that byte slicing would shift for any non-ASCII cell content.
+        return [
+            (_DIVIDER if self._is_divider_row(line) else 0)
+            | (_UNDERLINE if self._is_header_underline(line) else 0)
+            for line in text_lines
+        ]
 
-    def _name_if_header(self, four_rows: List[str]):
+    def _name_if_header(self, four_rows: Tuple[str, str, str, str]):
+        # The caller has already established the row below is an underline row
         above, header, below, tail = four_rows
-        # Row below potential section header must be an underline row
-        if not self._is_header_underline(below):
-            return None
         # Row above should be an matching overline or empty
         if above and not above == below:
             return None
@@ -300,47 +400,51 @@ class SimpleRSTReader(BaseRSTDataObject):
 
     def _parse(self, rst_string: FileContents):
         text_lines = rst_string.split("\n")
+        line_kinds = self._classify_lines(text_lines)
         section_header_cursor = None
+        line_count = len(text_lines)
         i = 0
-        while i < len(text_lines) - 1:
-            sliding_window = [
-                safe_list_index(text_lines, idx, default="")
-                for idx in range(i - 1, i + 3)
-            ]
-            header_check = self._name_if_header(sliding_window)
+        while i < line_count - 1:
+            header_check = None
+            # Row below potential section header must be an underline row
+            if line_kinds[i + 1] & _UNDERLINE:
+                sliding_window = (
+                    text_lines[i - 1] if i > 0 else "",
+                    text_lines[i],
+                    text_lines[i + 1],
+                    text_lines[i + 2] if i + 2 < line_count else "",
+                )
+                header_check = self._name_if_header(sliding_window)
             if header_check:
                 section_header_cursor = header_check
                 # skip past the section header AND the underline row
                 i += 2
                 continue
-            if self._is_divider_row(text_lines[i]):
-                header, rows = self._get_header_and_rows(text_lines[i:])
+            if line_kinds[i] & _DIVIDER:
+                header, rows = self._get_header_and_rows(text_lines, line_kinds, i)
                 table_name = self._table_name(section_header_cursor)
                 self.data[table_name] = SimpleRSTTable(text_lines[i], header, rows)
                 # The extra 4 rows 'skipped' are for the 3 divider rows and the header
                 i += len(rows) + 4
             i += 1
 
-    def _get_header_and_rows(self, text_lines: List[str]):
-        header, rows = None, None
-        # find the header
-        for i in range(len(text_lines)):
-            if self._is_divider_row(text_lines[i]):
-                if text_lines[i] != text_lines[i + 2]:
-                    raise InvalidFileException("Column divider rows do not match!")
-                header, rows = text_lines[i + 1], text_lines[i + 3 :]
-                break
-        # truncate remaining rows to just table contents
-        if rows:
-            for i in range(len(rows)):
-                if self._is_divider_row(rows[i]):
-                    rows = rows[:i]
-                    break
-        else:
+    def _get_header_and_rows(
+        self, text_lines: List[str], line_kinds: List[int], start: int
+    ):
+        # the caller guarantees the row at ``start`` is a divider row
+        first_row = start + 3
+        if first_row >= len(text_lines):
             raise InvalidFileException("Expected table rows could not be found!")
-        return header, rows
+        if text_lines[start] != text_lines[start + 2]:
+            raise InvalidFileException("Column divider rows do not match!")
+        header = text_lines[start + 1]
+        # truncate remaining rows to just table contents
+        end = first_row
+        while end < len(text_lines) and not line_kinds[end] & _DIVIDER:
+            end += 1
+        return header, text_lines[first_row:end]
 
     @property
     def tables(self):
         """Get the list of table names found in the document."""
-        return list(self.data.keys())
+        return list(self.data)
@@ -16,33 +16,36 @@ class SimpleRSTTableWriteable(object):
     def __init__(self, title: str, row_data: RowData):
         self.title = title
         self._headers = list(row_data[0].keys())
-        self.col_widths = self._col_widths(row_data)
+        cells, self.col_widths = self._cells_and_widths(row_data)
         self.col_mappings = list(zip(self._headers, self.col_widths))
-        self.rows = self._dict_to_lines(row_data)
-
-    def _format_row(self, row: dict):
-        return "  ".join(
-            ["{:{c}}".format(row.get(k, ""), c=c) for k, c in self.col_mappings]
-        )
-
-    def _dict_to_lines(self, row_data: RowData):
-        return [self._format_row(row) for row in row_data]
-
-    def _col_widths(self, row_data: RowData):
-        return [
-            max(len(col), *[len(str(row.get(col, ""))) for row in row_data])
-            for col in self._headers
-        ]
-
-    @property
-    def headers(self):
-        """Headers for the table, formatted as a spaced string."""
-        return "  ".join(["{:{c}}".format(k, c=c) for k, c in self.col_mappings])
-
-    @property
-    def divider(self):
-        """Format divider row as a spaced string."""
-        return "  ".join([self.divider_char * x for x in self.col_widths])
+        self._row_format = "  ".join("{:%d}" % width for width in self.col_widths)
+        #: Headers for the table, formatted as a spaced string.
+        self.headers = self._format_row(self._headers)
+        #: Divider row, formatted as a spaced string.
+        self.divider = "  ".join(self.divider_char * x for x in self.col_widths)
+        self._header_block = "\n".join([self.divider, self.headers, self.divider])
+        self.rows = self._cells_to_lines(cells)
+
+    def _format_row(self, cells: List[str]):
+        return self._row_format.format(*cells)
+
+    def _cells_to_lines(self, cells: List[List[str]]):
+        return [self._format_row(row) for row in cells]
+
+    def _cells_and_widths(self, row_data: RowData):
+        """Stringify every cell once, tracking the widest value per column."""
+        widths = [len(col) for col in self._headers]
+        cells = []
+        for row in row_data:
+            row_cells = []
+            for idx, col in enumerate(self._headers):
+                value = row.get(col, "")
+                cell = value if isinstance(value, str) else str(value)
+                if len(cell) > widths[idx]:
+                    widths[idx] = len(cell)
+                row_cells.append(cell)
+            cells.append(row_cells)
+        return cells, widths
 
     def write_table(self, writer: io.TextIOBase):
         """Write table out to file using the provided writer.
@@ -50,24 +53,11 @@ class SimpleRSTTableWriteable(object):
         Args:
             writer: file-like object to be written to
         """
-        self._write_title(writer)
-        self._write_headers(writer)
-        for row in self.rows:
-            self._write(writer, row)
-        self._write(writer, self.divider)
-
-    def _write_title(self, writer: io.TextIOBase):
-        self._write(writer, self.title)
-        self._write(writer, self.title_marker * len(self.title))
-        self._write(writer, "")
-
-    def _write_headers(self, writer: io.TextIOBase):
-        self._write(writer, self.divider)
-        self._write(writer, self.headers)
-        self._write(writer, self.divider)
-
-    def _write(self, writer: io.TextIOBase, string: str):
-        writer.write("{}\n".format(string))
+        title_underline = self.title_marker * len(self.title)
+        lines = [self.title, title_underline, "", self._header_block]
+        lines.extend(self.rows)
+        lines.extend([self.divider, ""])
+        writer.write("\n".join(lines))
 
 
 class SimpleRSTWriter(object):
@@ -85,14 +75,11 @@ class SimpleRSTWriter(object):
 
     def write_tables(self):
         """Write provided tables out to .rst file."""
-        if os.path.exists(self.file_path):
-            os.remove(self.file_path)
         dirname = os.path.dirname(self.file_path)
         if not os.path.exists(dirname):
             os.makedirs(dirname)
-        with open(self.file_path, "a") as writer:
+        with open(self.file_path, "w") as writer:
             for idx, table in enumerate(self.tables):
                 if idx:
-                    writer.write("\n")
-                    writer.write("\n")
+                    writer.write("\n\n")
                 table.write_table(writer)
@@ -236,3 +236,96 @@ def test_empty_rst_source_file_gives_error():
     tmp_file = tempfile.NamedTemporaryFile(suffix=".rst")
     with pytest.raises(tableread.InvalidFileException):
         tableread.SimpleRSTReader(tmp_file.name)
+
+
+def test_tables_with_same_fields_share_row_class():
+    reader = tableread.SimpleRSTReader(SAMPLE_TABLES + SAMPLE_TABLES)
+    first, repeat = reader["First Table"], reader["First Table_2"]
+    assert type(first[0]) is type(repeat[0])
+
+
+@pytest.mark.parametrize("reader", readers)
+def test_chained_filters(reader):
+    table = reader["Second Table"]
+    match = table.exclude_by(is_planet="Yes").matches_all(planet="pluto")
+    assert [row.planet for row in match] == ["Pluto"]
+    assert len(table.matches_all(is_planet="Yes").exclude_by(planet="Earth")) == 7
+
+
+def test_column_defaults_and_placeholders():
+    reader = tableread.SimpleRSTReader(
+        """
+=====  ==============  ========
+Name   Color=Unknown   Note
+=====  ==============  ========
+Bob    Red             ..
+Sue                    Hi
+Jim    ..              x..y
+=====  ==============  ========
+"""
+    )
+    assert list(map(attr.asdict, reader.first)) == [
+        {"name": "Bob", "color": "Red", "note": ""},
+        {"name": "Sue", "color": "Unknown", "note": "Hi"},
+        {"name": "Jim", "color": "Unknown", "note": "xy"},
+    ]
+
+
+@pytest.mark.parametrize("reader", readers)
+def test_filter_with_unknown_field_errors_immediately(reader):
+    with pytest.raises(AttributeError):
+        reader.first.matches_all(not_a_field="Bob")
+
+
+def test_filtered_views_over_generator_share_rows():
+    rows = tableread.SimpleRSTReader(SAMPLE_TABLES).first.data
+    view = tableread.SimpleRSTTable.from_data(
+        (row for row in rows), lambda row: row.name != "Sue"
+    )
+    assert len(view.matches_all(name="Bob")) == 1
+    assert len(view.matches_all(name="Jim")) == 1
+
+
+def test_overridden_divider_characters():
+    class DashTable(tableread.SimpleRSTTable):
+        header_divider = "-"
+
+    table = DashTable("----  ----", "Name  Size", ["Bob   3", "----  ----", "Sue   5"])
+    assert list(map(attr.asdict, table)) == [{"name": "Bob", "size": "3"}]
+
+
+@pytest.mark.parametrize("reader", readers)
+def test_callable_filter_deferred_until_first_use(reader):
+    calls = []
+
+    def is_bob(row):
+        calls.append(row)
+        return row.name == "Bob"
+
+    match = reader.first.matches_all(name=is_bob)
+    assert not calls
+    assert len(match) == 1
+    assert len(calls) == 3
+
+
+@pytest.mark.parametrize(
+    "rst_source", ["=====\nName", "=====\nName\n=====", "\n=====\nName\n"]
+)
+def test_truncated_table_gives_error(rst_source):
+    with pytest.raises(tableread.InvalidFileException, match="rows could not be found"):
+        tableread.SimpleRSTReader(rst_source)
+
+
+def test_mismatched_divider_rows_give_error():
+    with pytest.raises(tableread.InvalidFileException, match="do not match"):
+        tableread.SimpleRSTReader("=====\nName\n====\nBob\n=====")
+
+
+def test_row_class_shared_after_row_class_cache_eviction():
+    tableread._row_class.cache_clear()
+    first = tableread.SimpleRSTReader(SAMPLE_TABLES).first
+    tableread._row_class.cache_clear()
+    repeat = tableread.SimpleRSTReader(SAMPLE_TABLES).first
+    again = tableread.SimpleRSTReader(SAMPLE_TABLES).first
+    assert type(repeat[0]) is type(again[0])
+    assert type(first[0]) is not type(repeat[0])
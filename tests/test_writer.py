@@ -55,3 +55,11 @@ def test_table_data(temp_dir, table_one_data):
         attr.asdict(table_row) == _convert_col_names(test_row)
         for table_row, test_row in zip(table, table_one_data)
     )
+
+
+def test_non_string_values_written_as_text(temp_dir):
+    path = temp_dir + "test_file.rst"
+    rows = [{"Name": "Pluto", "Order": 9, "Planet": False}]
+    writer.SimpleRSTWriter(path, ("Planets", rows)).write_tables()
+    table = tableread.SimpleRSTReader(path).first
+    assert attr.asdict(table[0]) == {"name": "Pluto", "order": "9", "planet": "False"}